@@ -0,0 +1,19 @@
+# hushh_mcp/agents/ethical_consumption_agent/_score_products_jit.py
+
+# Numba-compiled catalog scoring. Kept in its own module so numba is only imported
+# (and the kernel only loaded or compiled) the first time a catalog is scored.
+
+import numba
+import numpy as np
+
+@numba.njit(cache=True, parallel=True)
+def score_products_kernel(env, lab, loc, anim, trans, weights):
+    """Weighted sum of the factor columns for every product, one thread-parallel pass."""
+    n = env.shape[0]
+    scores = np.empty(n, dtype=np.float32)
+    for i in numba.prange(n):
+        scores[i] = (
+            env[i] * weights[0] + lab[i] * weights[1] + loc[i] * weights[2]
+            + anim[i] * weights[3] + trans[i] * weights[4]
+        )
+    return scores
@@ -1,10 +1,10 @@
 import typer
-from typing import Optional
-import json
+from typing import List, Optional
 
-from hushh_mcp.consent.token import issue_token
 from hushh_mcp.constants import ConsentScope
-from .index import EthicalConsumptionAgent
+
+# The agent, token and json modules are imported inside each command so that
+# --help and argument errors don't pay for crypto/numpy start-up.
 
 app = typer.Typer(help="🌱 Ethical Consumption Agent - Make ethical purchasing decisions with privacy")
 
@@ -16,6 +16,9 @@ def quiz(
     """
     🌱 Assess your ethical values and preferences
     """
+    from hushh_mcp.consent.token import issue_token
+    from .index import EthicalConsumptionAgent
+
     try:
         # Issue consent token for values assessment
         token = issue_token(user_id, "ethical_consumption_agent", ConsentScope.CUSTOM_ETHICAL_VALUES)
@@ -45,6 +48,9 @@ def analyze(
     """
     📊 Analyze your purchase history for ethical insights
     """
+    from hushh_mcp.consent.token import issue_token
+    from .index import EthicalConsumptionAgent
+
     try:
         # Issue consent token for email/finance access
         token = issue_token(user_id, "ethical_consumption_agent", ConsentScope.VAULT_READ_EMAIL)
@@ -56,22 +62,25 @@ def analyze(
             analysis = result["analysis"]
             
             if format == "json":
+                import json
                 typer.echo(json.dumps(analysis, indent=2))
             else:
                 # Pretty table format
-                typer.echo(f"\n📊 Your Ethical Consumption Report ({period})")
-                typer.echo("=" * 50)
-                typer.echo(f"Ethical Score: {analysis['ethical_score']}/10 📈 (+{analysis['improvement_vs_last_period']['ethical']})")
-                typer.echo(f"Eco Score: {analysis['eco_score']}/10 🌱 (+{analysis['improvement_vs_last_period']['eco']})")
-                typer.echo(f"Total Purchases: {analysis['total_purchases']}")
+                out: List[str] = []
+                out.append(f"\n📊 Your Ethical Consumption Report ({period})")
+                out.append("=" * 50)
+                out.append(f"Ethical Score: {analysis['ethical_score']}/10 📈 (+{analysis['improvement_vs_last_period']['ethical']})")
+                out.append(f"Eco Score: {analysis['eco_score']}/10 🌱 (+{analysis['improvement_vs_last_period']['eco']})")
+                out.append(f"Total Purchases: {analysis['total_purchases']}")
                 
-                typer.echo("\n🔍 Top Issues Found:")
+                out.append("\n🔍 Top Issues Found:")
                 for issue in analysis['top_issues']:
-                    typer.echo(f"  • {issue}")
+                    out.append(f"  • {issue}")
                 
-                typer.echo("\n💡 Recommendations:")
+                out.append("\n💡 Recommendations:")
                 for rec in analysis['recommendations']:
-                    typer.echo(f"  • {rec}")
+                    out.append(f"  • {rec}")
+                typer.echo("\n".join(out))
                     
         else:
             typer.echo(f"❌ Error: {result.get('error', 'Unknown error')}")
@@ -93,6 +102,9 @@ def search(
     """
     🔍 Search for products with ethical analysis
     """
+    from hushh_mcp.consent.token import issue_token
+    from .index import EthicalConsumptionAgent
+
     try:
         # Issue consent token for shopping access
         token = issue_token(user_id, "ethical_consumption_agent", ConsentScope.AGENT_SHOPPING_PURCHASE)
@@ -104,31 +116,34 @@ def search(
             results = result["results"]
             
             if format == "json":
+                import json
                 typer.echo(json.dumps(results, indent=2))
             else:
                 # Pretty table format
-                typer.echo(f"\n🔍 Ethical Product Search: '{query}'")
+                out: List[str] = []
+                out.append(f"\n🔍 Ethical Product Search: '{query}'")
                 if budget:
-                    typer.echo(f"💰 Budget: ${budget}")
-                typer.echo(f"📊 Analyzed {results['total_options_analyzed']} options")
-                typer.echo("=" * 60)
+                    out.append(f"💰 Budget: ${budget}")
+                out.append(f"📊 Analyzed {results['total_options_analyzed']} options")
+                out.append("=" * 60)
                 
-                typer.echo("\n🏆 Best Ethical Choices:")
+                out.append("\n🏆 Best Ethical Choices:")
                 for i, rec in enumerate(results['recommendations'], 1):
-                    typer.echo(f"\n{i}. {rec['name']} - ${rec['price']}")
-                    typer.echo(f"   ✅ Ethical Score: {rec['ethical_score']}/10")
-                    typer.echo(f"   🌱 Eco Score: {rec['eco_score']}/10")
-                    typer.echo(f"   🏷️  Certifications: {', '.join(rec['certifications'])}")
-                    typer.echo(f"   💪 Strengths: {', '.join(rec['strengths'])}")
-                    typer.echo(f"   🔗 Source: {rec['source']}")
+                    out.append(f"\n{i}. {rec['name']} - ${rec['price']}")
+                    out.append(f"   ✅ Ethical Score: {rec['ethical_score']}/10")
+                    out.append(f"   🌱 Eco Score: {rec['eco_score']}/10")
+                    out.append(f"   🏷️  Certifications: {', '.join(rec['certifications'])}")
+                    out.append(f"   💪 Strengths: {', '.join(rec['strengths'])}")
+                    out.append(f"   🔗 Source: {rec['source']}")
                 
                 # Show mainstream comparison
                 mainstream = results['mainstream_comparison']
-                typer.echo(f"\n⚠️  Popular Choice (for comparison):")
-                typer.echo(f"   {mainstream['name']} - ${mainstream['price']}")
-                typer.echo(f"   ❌ Ethical Score: {mainstream['ethical_score']}/10")
-                typer.echo(f"   ❌ Eco Score: {mainstream['eco_score']}/10")
-                typer.echo(f"   ⚠️  Issues: {', '.join(mainstream['issues'])}")
+                out.append(f"\n⚠️  Popular Choice (for comparison):")
+                out.append(f"   {mainstream['name']} - ${mainstream['price']}")
+                out.append(f"   ❌ Ethical Score: {mainstream['ethical_score']}/10")
+                out.append(f"   ❌ Eco Score: {mainstream['eco_score']}/10")
+                out.append(f"   ⚠️  Issues: {', '.join(mainstream['issues'])}")
+                typer.echo("\n".join(out))
                     
         else:
             typer.echo(f"❌ Error: {result.get('error', 'Unknown error')}")
@@ -149,6 +164,9 @@ def trace(
     """
     🔗 Trace supply chain for a specific product
     """
+    from hushh_mcp.consent.token import issue_token
+    from .index import EthicalConsumptionAgent
+
     try:
         # Issue consent token for supply chain access
         token = issue_token(user_id, "ethical_consumption_agent", ConsentScope.CUSTOM_SUPPLY_CHAIN)
@@ -160,31 +178,34 @@ def trace(
             trace = result["supply_chain_analysis"]
             
             if format == "json":
+                import json
                 typer.echo(json.dumps(trace, indent=2))
             else:
                 # Pretty table format
+                out: List[str] = []
                 supply_chain = trace['supply_chain']
-                typer.echo(f"\n🔗 Supply Chain Analysis")
-                typer.echo("=" * 50)
-                typer.echo(f"Manufacturer: {supply_chain['manufacturer']}")
-                typer.echo(f"Location: {supply_chain['manufacturing_location']}")
-                typer.echo(f"Overall Score: {trace['overall_supply_chain_score']}/10")
+                out.append(f"\n🔗 Supply Chain Analysis")
+                out.append("=" * 50)
+                out.append(f"Manufacturer: {supply_chain['manufacturer']}")
+                out.append(f"Location: {supply_chain['manufacturing_location']}")
+                out.append(f"Overall Score: {trace['overall_supply_chain_score']}/10")
                 
-                typer.echo(f"\n🌍 Raw Materials Origin:")
+                out.append(f"\n🌍 Raw Materials Origin:")
                 for origin in supply_chain['raw_materials_origin']:
-                    typer.echo(f"  • {origin}")
+                    out.append(f"  • {origin}")
                 
-                typer.echo(f"\n🏷️ Certifications:")
+                out.append(f"\n🏷️ Certifications:")
                 for cert in supply_chain['labor_certifications'] + supply_chain['environmental_certifications']:
-                    typer.echo(f"  • {cert}")
+                    out.append(f"  • {cert}")
                 
-                typer.echo(f"\n⚠️ Ethical Concerns:")
+                out.append(f"\n⚠️ Ethical Concerns:")
                 for concern in trace['ethical_concerns']:
-                    typer.echo(f"  • {concern}")
+                    out.append(f"  • {concern}")
                 
-                typer.echo(f"\n✅ Positive Factors:")
+                out.append(f"\n✅ Positive Factors:")
                 for factor in trace['positive_factors']:
-                    typer.echo(f"  • {factor}")
+                    out.append(f"  • {factor}")
+                typer.echo("\n".join(out))
                     
         else:
             typer.echo(f"❌ Error: {result.get('error', 'Unknown error')}")
@@ -204,6 +225,9 @@ def report(
     """
     📋 Generate comprehensive ethical consumption report
     """
+    from hushh_mcp.consent.token import issue_token
+    from .index import EthicalConsumptionAgent
+
     try:
         # Issue consent token for comprehensive access
         token = issue_token(user_id, "ethical_consumption_agent", ConsentScope.VAULT_READ_EMAIL)
@@ -215,28 +239,31 @@ def report(
             report_data = result["report"]
             
             if format == "json":
+                import json
                 typer.echo(json.dumps(report_data, indent=2))
             else:
                 # Pretty table format
-                typer.echo(f"\n📋 Comprehensive Ethical Consumption Report")
-                typer.echo(f"📅 Report Date: {report_data['report_date']}")
-                typer.echo("=" * 60)
+                out: List[str] = []
+                out.append(f"\n📋 Comprehensive Ethical Consumption Report")
+                out.append(f"📅 Report Date: {report_data['report_date']}")
+                out.append("=" * 60)
                 
-                typer.echo(f"\n📈 Score Trends:")
-                typer.echo(f"Ethical Scores: {' → '.join(map(str, report_data['ethical_score_trend']))}")
-                typer.echo(f"Eco Scores: {' → '.join(map(str, report_data['eco_score_trend']))}")
+                out.append(f"\n📈 Score Trends:")
+                out.append(f"Ethical Scores: {' → '.join(map(str, report_data['ethical_score_trend']))}")
+                out.append(f"Eco Scores: {' → '.join(map(str, report_data['eco_score_trend']))}")
                 
-                typer.echo(f"\n🏆 Top Achievements:")
+                out.append(f"\n🏆 Top Achievements:")
                 for achievement in report_data['top_achievements']:
-                    typer.echo(f"  • {achievement}")
+                    out.append(f"  • {achievement}")
                 
-                typer.echo(f"\n🎯 Areas for Improvement:")
+                out.append(f"\n🎯 Areas for Improvement:")
                 for area in report_data['areas_for_improvement']:
-                    typer.echo(f"  • {area}")
+                    out.append(f"  • {area}")
                 
-                typer.echo(f"\n💡 Personalized Recommendations:")
+                out.append(f"\n💡 Personalized Recommendations:")
                 for rec in report_data['personalized_recommendations']:
-                    typer.echo(f"  • {rec}")
+                    out.append(f"  • {rec}")
+                typer.echo("\n".join(out))
                     
         else:
             typer.echo(f"❌ Error: {result.get('error', 'Unknown error')}")
@@ -248,5 +275,15 @@ def report(
         typer.echo(f"❌ Error: {e}")
         raise typer.Exit(1)
 
+@app.command("clear-cache")
+def clear_cache():
+    """
+    🧹 Forget cached product search results
+    """
+    from .index import EthicalConsumptionAgent
+
+    EthicalConsumptionAgent.clear_search_cache()
+    typer.echo("✅ Cleared cached search results")
+
 if __name__ == "__main__":
     app() 
\ No newline at end of file
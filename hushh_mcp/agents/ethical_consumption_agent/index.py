@@ -1,23 +1,149 @@
-from typing import Dict, List, Any, Optional
-import json
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
 import re
+import time
+import hashlib
+import asyncio
+import inspect
 from dataclasses import dataclass
+from functools import lru_cache, wraps
 
-from hushh_mcp.consent.token import validate_token
+import numpy as np
+import orjson
+
+from hushh_mcp.consent.token import validate_token, is_token_revoked
 from hushh_mcp.constants import ConsentScope
-from hushh_mcp.types import UserID
-from hushh_mcp.vault.encrypt import encrypt_data, decrypt_data
+from hushh_mcp.types import UserID, HushhConsentToken
+from hushh_mcp.vault.encrypt import encrypt_bytes, decrypt_data
 from hushh_mcp.config import VAULT_ENCRYPTION_KEY
 
-@dataclass
-class EthicalValues:
+# ==================== Mock Data ====================
+
+# Each mock is serialized once at import. Every call decodes its own copy with
+# orjson.loads, so callers can mutate results without touching later calls.
+
+# Mock analysis - in real implementation would parse emails/transactions
+_MOCK_ANALYSIS = {
+    "total_purchases": 47,
+    "ethical_score": 6.2,
+    "eco_score": 7.1,
+    "improvement_vs_last_period": {
+        "ethical": 0.8,
+        "eco": 1.2
+    },
+    "top_issues": [
+        "23% of purchases from companies with poor labor practices",
+        "67% of electronics from non-certified suppliers", 
+        "Opportunity: 15 local alternatives available for frequent purchases"
+    ],
+    "recommendations": [
+        "Consider B-Corp certified alternatives for your next electronics purchase",
+        "Look for Fair Trade certified options in your regular grocery shopping",
+        "Explore local farmers markets for produce and packaged goods"
+    ]
+}
+
+_MOCK_ANALYSIS_JSON = orjson.dumps(_MOCK_ANALYSIS)
+_MOCK_ANALYSIS_ENCRYPTED = encrypt_bytes(_MOCK_ANALYSIS_JSON, VAULT_ENCRYPTION_KEY)
+
+_MOCK_SEARCH_TEMPLATE = {
+    "total_options_analyzed": 47,
+    "recommendations": [
+        {
+            "name": "Fairphone Headphones",
+            "price": 180,
+            "ethical_score": 9.2,
+            "eco_score": 8.8,
+            "certifications": ["Fair Trade", "Recyclable Materials"],
+            "strengths": ["Transparent supply chain", "Worker-owned factories", "Biodegradable packaging"],
+            "source": "fairphone.com"
+        },
+        {
+            "name": "Patagonia Audio Gear", 
+            "price": 195,
+            "ethical_score": 8.7,
+            "eco_score": 9.1,
+            "certifications": ["B-Corp", "1% for the Planet"],
+            "strengths": ["Carbon neutral shipping", "Repair program", "Recycled materials"],
+            "source": "patagonia.com"
+        }
+    ],
+    "mainstream_comparison": {
+        "name": "Sony XM4",
+        "price": 199,
+        "ethical_score": 4.1,
+        "eco_score": 3.8,
+        "issues": ["Supply chain concerns in 3rd party factories", "Limited transparency", "Non-renewable materials"]
+    }
+}
+
+_MOCK_SEARCH_JSON = orjson.dumps(_MOCK_SEARCH_TEMPLATE)
+
+# Mock supply chain analysis
+_MOCK_TRACE = {
+    "supply_chain": {
+        "manufacturer": "TechCorp Manufacturing Ltd",
+        "manufacturing_location": "Shenzhen, China",
+        "raw_materials_origin": ["Democratic Republic of Congo (cobalt)", "Chile (lithium)", "Indonesia (nickel)"],
+        "labor_certifications": ["SA8000", "WRAP"],
+        "environmental_certifications": ["ISO14001"],
+        "transparency_score": 6.5
+    },
+    "ethical_concerns": [
+        "Cobalt sourcing from conflict regions",
+        "Limited visibility into Tier 2/3 suppliers",
+        "No living wage certification for factory workers"
+    ],
+    "positive_factors": [
+        "Third-party labor audits conducted annually",
+        "Waste reduction program in manufacturing",
+        "Supplier code of conduct published"
+    ],
+    "overall_supply_chain_score": 5.8
+}
+
+_MOCK_TRACE_JSON = orjson.dumps(_MOCK_TRACE)
+
+# Mock comprehensive report, split by the data source each section comes from
+_MOCK_REPORT_DATE = "2024-01-15"
+
+_MOCK_REPORT_EMAIL = {
+    "ethical_score_trend": [5.4, 5.8, 6.0, 6.2],
+    "eco_score_trend": [5.9, 6.4, 6.8, 7.1]
+}
+
+_MOCK_REPORT_FINANCE = {
+    "top_achievements": [
+        "Increased purchases from B-Corp certified companies by 35%",
+        "Reduced carbon footprint from shopping by 18%",
+        "Supported 12 local businesses this quarter"
+    ],
+    "areas_for_improvement": [
+        "Electronics sourcing - consider refurbished options",
+        "Fast fashion purchases - explore sustainable brands",
+        "Food packaging - look for zero-waste alternatives"
+    ]
+}
+
+_MOCK_REPORT_SHOPPING = {
+    "personalized_recommendations": [
+        "Based on your environmental priority, consider Patagonia for outdoor gear",
+        "For electronics, Fairphone aligns with your transparency values",
+        "Local farmers market on Saturdays matches your local sourcing preference"
+    ]
+}
+
+_MOCK_REPORT_EMAIL_JSON = orjson.dumps(_MOCK_REPORT_EMAIL)
+_MOCK_REPORT_FINANCE_JSON = orjson.dumps(_MOCK_REPORT_FINANCE)
+_MOCK_REPORT_SHOPPING_JSON = orjson.dumps(_MOCK_REPORT_SHOPPING)
+
+class EthicalValues(NamedTuple):
     environmental_importance: int  # 1-5
     labor_practices_importance: int  # 1-5
     local_sourcing_preference: int  # 1-5
     animal_welfare_importance: int  # 1-5
     transparency_importance: int  # 1-5
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EthicalScore:
     overall_score: float
     environmental_score: float  
@@ -26,10 +152,100 @@ class EthicalScore:
     transparency_score: float
     reasons: List[str]
 
+@dataclass(frozen=True, slots=True)
+class ProductCatalog:
+    """Products stored column-wise: one float32 array per ethical factor (0-10 scale)."""
+    names: List[str]
+    environmental: np.ndarray
+    labor: np.ndarray
+    local_sourcing: np.ndarray
+    animal_welfare: np.ndarray
+    transparency: np.ndarray
+
+    @classmethod
+    def from_products(cls, products: List[Dict[str, Any]]) -> "ProductCatalog":
+        """Build a catalog from product dicts; missing factor scores default to a neutral 5.0."""
+        def column(key: str) -> np.ndarray:
+            return np.fromiter((p.get(key, 5.0) for p in products), dtype=np.float32, count=len(products))
+
+        return cls(
+            names=[p["name"] for p in products],
+            environmental=column("environmental"),
+            labor=column("labor"),
+            local_sourcing=column("local_sourcing"),
+            animal_welfare=column("animal_welfare"),
+            transparency=column("transparency")
+        )
+
+# ==================== Scoring Kernel ====================
+
+def _score_products_numpy(env, lab, loc, anim, trans, weights):
+    """Weighted sum of the factor columns for every product."""
+    return env * weights[0] + lab * weights[1] + loc * weights[2] + anim * weights[3] + trans * weights[4]
+
+# Resolved on first use by _get_score_products_kernel
+_score_products_kernel = None
+
+def _get_score_products_kernel():
+    """
+    The Numba kernel when numba is installed, else the NumPy version. Imported lazily
+    so constructing the agent (and every CLI command) doesn't pay for numba start-up
+    or kernel loading unless products are actually scored.
+    """
+    global _score_products_kernel
+    if _score_products_kernel is None:
+        try:
+            from hushh_mcp.agents.ethical_consumption_agent._score_products_jit import score_products_kernel
+        except ImportError:
+            score_products_kernel = _score_products_numpy
+        _score_products_kernel = score_products_kernel
+    return _score_products_kernel
+
+def requires_scope(scope_key: str):
+    """
+    Guard an agent method with consent validation for required_scopes[scope_key]:
+    the token must be valid for that scope and belong to the user the method acts for.
+    Works for both regular and async methods.
+    """
+    def check(self, user_id: UserID, token_str: str) -> None:
+        valid, reason, token = self._validated(token_str, self.required_scopes[scope_key])
+        if not valid:
+            raise PermissionError(f"Consent validation failed: {reason}")
+        if token.user_id != user_id:
+            raise PermissionError("Token user ID does not match provided user")
+
+    def decorator(fn):
+        if inspect.iscoroutinefunction(fn):
+            @wraps(fn)
+            async def async_wrapper(self, user_id: UserID, token_str: str, *args, **kwargs):
+                check(self, user_id, token_str)
+                return await fn(self, user_id, token_str, *args, **kwargs)
+            return async_wrapper
+
+        @wraps(fn)
+        def wrapper(self, user_id: UserID, token_str: str, *args, **kwargs):
+            check(self, user_id, token_str)
+            return fn(self, user_id, token_str, *args, **kwargs)
+        return wrapper
+    return decorator
+
 class EthicalConsumptionAgent:
     """
     Privacy-first agent for ethical consumption analysis and product recommendations.
     """
+
+    # Successful validations keyed by (blake2b(token), scope) -> (expires_at_ms, result).
+    # Shared across instances so repeated agents in one process skip re-verification.
+    _token_cache: Dict[Tuple[str, str], Tuple[int, Tuple[bool, Optional[str], Optional[HushhConsentToken]]]] = {}
+    _token_cache_maxsize = 1024
+    _token_cache_ttl_ms = 60 * 1000
+
+    # Product analysis keyed by (normalized query, budget) -> (monotonic expiry, serialized results).
+    # Not user-specific, so entries are shared by every user of the process; each hit
+    # decodes a fresh copy so one caller's changes can't leak to the next.
+    _search_cache: Dict[Tuple[str, Optional[int]], Tuple[float, bytes]] = {}
+    _search_cache_maxsize = 256
+    _search_cache_ttl_s = 10 * 60
     
     def __init__(self, agent_id: str = "ethical_consumption_agent"):
         self.agent_id = agent_id
@@ -41,18 +257,11 @@ class EthicalConsumptionAgent:
             "supply_chain": ConsentScope.CUSTOM_SUPPLY_CHAIN
         }
 
+    @requires_scope("values_access")
     def assess_ethical_values(self, user_id: UserID, token_str: str) -> Dict[str, Any]:
         """
         Interactive quiz to assess user's ethical values and preferences.
         """
-        valid, reason, token = validate_token(token_str, expected_scope=self.required_scopes["values_access"])
-        
-        if not valid:
-            raise PermissionError(f"Consent validation failed: {reason}")
-        
-        if token.user_id != user_id:
-            raise PermissionError("Token user ID does not match provided user")
-            
         print("🌱 Welcome to the Ethical Values Assessment")
         print("This helps us understand your priorities for ethical consumption.\n")
         
@@ -80,8 +289,8 @@ class EthicalConsumptionAgent:
         
         ethical_values = EthicalValues(**values)
         
-        encrypted_values = encrypt_data(
-            json.dumps(values), 
+        encrypted_values = encrypt_bytes(
+            orjson.dumps(values),
             VAULT_ENCRYPTION_KEY
         )
         
@@ -94,103 +303,31 @@ class EthicalConsumptionAgent:
             "summary": self._generate_values_summary(ethical_values)
         }
 
+    @requires_scope("email_access")
     def analyze_purchase_history(self, user_id: UserID, token_str: str, period: str = "last_6_months") -> Dict[str, Any]:
         """
         Analyze historical purchases and generate ethical/eco scores.
         """
-        valid, reason, token = validate_token(token_str, expected_scope=self.required_scopes["email_access"])
-        
-        if not valid:
-            raise PermissionError(f"Consent validation failed: {reason}")
-            
-        if token.user_id != user_id:
-            raise PermissionError("Token user ID does not match provided user")
-            
         print(f"🔍 Analyzing purchase history for {period}...")
         
-        # Mock analysis - in real implementation would parse emails/transactions
-        mock_analysis = {
-            "total_purchases": 47,
-            "ethical_score": 6.2,
-            "eco_score": 7.1,
-            "improvement_vs_last_period": {
-                "ethical": 0.8,
-                "eco": 1.2
-            },
-            "top_issues": [
-                "23% of purchases from companies with poor labor practices",
-                "67% of electronics from non-certified suppliers", 
-                "Opportunity: 15 local alternatives available for frequent purchases"
-            ],
-            "recommendations": [
-                "Consider B-Corp certified alternatives for your next electronics purchase",
-                "Look for Fair Trade certified options in your regular grocery shopping",
-                "Explore local farmers markets for produce and packaged goods"
-            ]
-        }
-        
-        encrypted_analysis = encrypt_data(
-            json.dumps(mock_analysis),
-            VAULT_ENCRYPTION_KEY
-        )
-        
         return {
             "status": "success", 
-            "analysis": mock_analysis,
-            "encrypted_data": encrypted_analysis,
+            "analysis": orjson.loads(_MOCK_ANALYSIS_JSON),
+            "encrypted_data": _MOCK_ANALYSIS_ENCRYPTED.model_copy(),
             "period": period
         }
 
+    @requires_scope("shopping_access")
     def search_ethical_products(self, user_id: UserID, token_str: str, query: str, budget: Optional[int] = None) -> Dict[str, Any]:
         """
         Search for products and score them on ethical/environmental factors.
         """
-        valid, reason, token = validate_token(token_str, expected_scope=self.required_scopes["shopping_access"])
-        
-        if not valid:
-            raise PermissionError(f"Consent validation failed: {reason}")
-            
-        if token.user_id != user_id:
-            raise PermissionError("Token user ID does not match provided user")
-            
         print(f"🔍 Searching for '{query}' with ethical analysis...")
         
         if budget:
             print(f"💰 Budget constraint: ${budget}")
             
-        # Mock product search and scoring
-        mock_results = {
-            "query": query,
-            "total_options_analyzed": 47,
-            "budget": budget,
-            "recommendations": [
-                {
-                    "name": "Fairphone Headphones",
-                    "price": 180,
-                    "ethical_score": 9.2,
-                    "eco_score": 8.8,
-                    "certifications": ["Fair Trade", "Recyclable Materials"],
-                    "strengths": ["Transparent supply chain", "Worker-owned factories", "Biodegradable packaging"],
-                    "source": "fairphone.com"
-                },
-                {
-                    "name": "Patagonia Audio Gear", 
-                    "price": 195,
-                    "ethical_score": 8.7,
-                    "eco_score": 9.1,
-                    "certifications": ["B-Corp", "1% for the Planet"],
-                    "strengths": ["Carbon neutral shipping", "Repair program", "Recycled materials"],
-                    "source": "patagonia.com"
-                }
-            ],
-            "mainstream_comparison": {
-                "name": "Sony XM4",
-                "price": 199,
-                "ethical_score": 4.1,
-                "eco_score": 3.8,
-                "issues": ["Supply chain concerns in 3rd party factories", "Limited transparency", "Non-renewable materials"]
-            }
-        }
+        mock_results = {"query": query, "budget": budget, **self._search_products(query, budget)}
         
         return {
             "status": "success",
@@ -198,46 +335,42 @@ class EthicalConsumptionAgent:
             "timestamp": "2024-01-15T10:30:00Z"
         }
 
+    @classmethod
+    def clear_search_cache(cls) -> None:
+        """Drop all cached product search results."""
+        cls._search_cache.clear()
+
+    def _search_products(self, query: str, budget: Optional[int]) -> Dict[str, Any]:
+        """Search and score products, reusing results for a repeated query within the TTL."""
+        key = (query.strip().lower(), budget)
+        now = time.monotonic()
+
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            expires_at, results_json = cached
+            if now < expires_at:
+                return orjson.loads(results_json)
+            self._search_cache.pop(key, None)
+
+        # Mock product search and scoring
+        results_json = _MOCK_SEARCH_JSON
+
+        if len(self._search_cache) >= self._search_cache_maxsize:
+            self._search_cache.pop(next(iter(self._search_cache), None), None)
+        self._search_cache[key] = (now + self._search_cache_ttl_s, results_json)
+        return orjson.loads(results_json)
+
+    @requires_scope("supply_chain")
     def trace_supply_chain(self, user_id: UserID, token_str: str, product_url: str) -> Dict[str, Any]:
         """
         Trace supply chain for a specific product and analyze ethical factors.
         """
-        valid, reason, token = validate_token(token_str, expected_scope=self.required_scopes["supply_chain"])
-        
-        if not valid:
-            raise PermissionError(f"Consent validation failed: {reason}")
-            
-        if token.user_id != user_id:
-            raise PermissionError("Token user ID does not match provided user")
-            
         print(f"🔗 Tracing supply chain for: {product_url}")
         
-        # Mock supply chain analysis
-        mock_trace = {
-            "product_url": product_url,
-            "supply_chain": {
-                "manufacturer": "TechCorp Manufacturing Ltd",
-                "manufacturing_location": "Shenzhen, China",
-                "raw_materials_origin": ["Democratic Republic of Congo (cobalt)", "Chile (lithium)", "Indonesia (nickel)"],
-                "labor_certifications": ["SA8000", "WRAP"],
-                "environmental_certifications": ["ISO14001"],
-                "transparency_score": 6.5
-            },
-            "ethical_concerns": [
-                "Cobalt sourcing from conflict regions",
-                "Limited visibility into Tier 2/3 suppliers",
-                "No living wage certification for factory workers"
-            ],
-            "positive_factors": [
-                "Third-party labor audits conducted annually",
-                "Waste reduction program in manufacturing",
-                "Supplier code of conduct published"
-            ],
-            "overall_supply_chain_score": 5.8
-        }
+        mock_trace = {"product_url": product_url, **orjson.loads(_MOCK_TRACE_JSON)}
         
-        encrypted_trace = encrypt_data(
-            json.dumps(mock_trace),
+        encrypted_trace = encrypt_bytes(
+            orjson.dumps(mock_trace),
             VAULT_ENCRYPTION_KEY
         )
         
@@ -247,47 +380,112 @@ class EthicalConsumptionAgent:
             "encrypted_data": encrypted_trace
         }
 
+    @requires_scope("email_access")
     def generate_report(self, user_id: UserID, token_str: str) -> Dict[str, Any]:
         """
         Generate comprehensive ethical consumption report.
+        Sources are read one after another; async callers should await
+        generate_report_async to fetch them concurrently instead.
         """
         # This would combine data from multiple scopes
-        valid, reason, token = validate_token(token_str, expected_scope=self.required_scopes["email_access"])
+        print("📊 Generating comprehensive ethical consumption report...")
         
-        if not valid:
-            raise PermissionError(f"Consent validation failed: {reason}")
-            
+        sections = []
+        for fetch in self._report_sources():
+            try:
+                sections.append(fetch(user_id))
+            except Exception as e:
+                sections.append(e)
+        
+        return self._build_report(user_id, sections)
+
+    @requires_scope("email_access")
+    async def generate_report_async(self, user_id: UserID, token_str: str) -> Dict[str, Any]:
+        """
+        Generate comprehensive ethical consumption report, fetching every data source
+        concurrently in worker threads.
+        """
         print("📊 Generating comprehensive ethical consumption report...")
         
-        # Mock comprehensive report
-        report = {
-            "user_id": user_id,
-            "report_date": "2024-01-15",
-            "ethical_score_trend": [5.4, 5.8, 6.0, 6.2],
-            "eco_score_trend": [5.9, 6.4, 6.8, 7.1], 
-            "top_achievements": [
-                "Increased purchases from B-Corp certified companies by 35%",
-                "Reduced carbon footprint from shopping by 18%",
-                "Supported 12 local businesses this quarter"
-            ],
-            "areas_for_improvement": [
-                "Electronics sourcing - consider refurbished options",
-                "Fast fashion purchases - explore sustainable brands",
-                "Food packaging - look for zero-waste alternatives"
-            ],
-            "personalized_recommendations": [
-                "Based on your environmental priority, consider Patagonia for outdoor gear",
-                "For electronics, Fairphone aligns with your transparency values",
-                "Local farmers market on Saturdays matches your local sourcing preference"
-            ]
-        }
+        sections = await asyncio.gather(
+            *(asyncio.to_thread(fetch, user_id) for fetch in self._report_sources()),
+            return_exceptions=True
+        )
+        
+        return self._build_report(user_id, sections)
+
+    def _report_sources(self):
+        """Fetchers for each report section, in report order."""
+        return (self._fetch_email_data, self._fetch_finance_data, self._fetch_shopping_data)
+
+    def _build_report(self, user_id: UserID, sections: List[Any]) -> Dict[str, Any]:
+        """Combine fetched sections into a report; sources that failed are left out."""
+        report = {"user_id": user_id, "report_date": _MOCK_REPORT_DATE}
+        for section in sections:
+            if isinstance(section, Exception):
+                print(f"⚠️ Skipping unavailable report source: {section}")
+                continue
+            report.update(section)
         
         return {
             "status": "success",
             "report": report
         }
 
-    def _generate_values_summary(self, values: EthicalValues) -> str:
+    def _fetch_email_data(self, user_id: UserID) -> Dict[str, Any]:
+        # Mock fetch - in real implementation would parse receipts from the email vault
+        return orjson.loads(_MOCK_REPORT_EMAIL_JSON)
+
+    def _fetch_finance_data(self, user_id: UserID) -> Dict[str, Any]:
+        # Mock fetch - in real implementation would read transactions from the finance vault
+        return orjson.loads(_MOCK_REPORT_FINANCE_JSON)
+
+    def _fetch_shopping_data(self, user_id: UserID) -> Dict[str, Any]:
+        # Mock fetch - in real implementation would query shopping partner APIs
+        return orjson.loads(_MOCK_REPORT_SHOPPING_JSON)
+
+    def score_products(self, catalog: ProductCatalog, values: EthicalValues) -> np.ndarray:
+        """
+        Score every product in the catalog against the user's ethical values.
+        Returns one 0-10 score per product, aligned with catalog.names.
+        """
+        weights = np.asarray(values, dtype=np.float32)
+        weights /= weights.sum()
+        return _get_score_products_kernel()(
+            catalog.environmental,
+            catalog.labor,
+            catalog.local_sourcing,
+            catalog.animal_welfare,
+            catalog.transparency,
+            weights
+        )
+
+    def _validated(self, token_str: str, scope: ConsentScope) -> Tuple[bool, Optional[str], Optional[HushhConsentToken]]:
+        """Validate a consent token, reusing a recent successful validation when possible."""
+        key = (hashlib.blake2b(token_str.encode(), digest_size=16).hexdigest(), scope.value)
+        now_ms = int(time.time() * 1000)
+
+        cached = self._token_cache.get(key)
+        if cached is not None:
+            expires_at, result = cached
+            # Revocation must take effect immediately, so it is checked on every hit
+            if now_ms < expires_at and not is_token_revoked(token_str):
+                return result
+            self._token_cache.pop(key, None)
+
+        result = validate_token(token_str, expected_scope=scope)
+        valid, _, token = result
+        if valid:
+            if len(self._token_cache) >= self._token_cache_maxsize:
+                # Evict the oldest entry (dicts preserve insertion order)
+                self._token_cache.pop(next(iter(self._token_cache), None), None)
+            expires_at = min(now_ms + self._token_cache_ttl_ms, token.expires_at)
+            self._token_cache[key] = (expires_at, result)
+        return result
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _generate_values_summary(values: EthicalValues) -> str:
         """Generate human-readable summary of user values."""
         priorities = []
         
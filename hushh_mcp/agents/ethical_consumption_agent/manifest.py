@@ -18,7 +18,8 @@ manifest = {
     "dependencies": [
         "requests>=2.32.3",
         "beautifulsoup4>=4.12.0", 
-        "pandas>=2.0.0",
-        "typer>=0.9.0"
+        "numpy>=1.24.0",
+        "typer>=0.9.0",
+        "orjson>=3.9.0"
     ]
 } 
\ No newline at end of file
@@ -0,0 +1,53 @@
+# hushh_mcp/operons/_score_ethical_factors_jit.py
+
+# Numba-compiled batch scoring for score_ethical_factors_batch. Kept in its own module
+# so numba is only imported (and the kernel only loaded or compiled) the first time
+# a batch is scored.
+
+import numba
+import numpy as np
+
+from hushh_mcp.operons.score_ethical_factors import (
+    _CERT_COUNT,
+    _ENV_BONUS,
+    _ENV_SHIFT,
+    _FLAGS,
+    _LABOR_BONUS,
+    _LABOR_SHIFT,
+    _SUPPLY_BONUS,
+    _SUPPLY_SHIFT,
+    _TRANS_BONUS,
+    _TRANS_SHIFT,
+    _TRANSPARENCY_LEVEL,
+)
+
+# No fastmath: reassociating the sums would let batch results drift from score_ethical_factors
+@numba.njit(cache=True, parallel=True)
+def score_kernel(features, weight_index, weight_values, user_flags):
+    """Same contract as _score_kernel_numpy, one thread-parallel pass over the products."""
+    n = features.shape[0]
+    out = np.empty((n, 7))
+    for i in numba.prange(n):
+        flags = np.int64(features[i, _FLAGS])
+        env = min(5.0 + _ENV_BONUS[(flags >> _ENV_SHIFT) & 0xF], 10.0)
+        labor = min(5.0 + _LABOR_BONUS[(flags >> _LABOR_SHIFT) & 0xF], 10.0)
+        supply = min(features[i, _TRANSPARENCY_LEVEL] + _SUPPLY_BONUS[(flags >> _SUPPLY_SHIFT) & 0x3], 10.0)
+        trans = min(5.0 + _TRANS_BONUS[(flags >> _TRANS_SHIFT) & 0x7], 10.0)
+        out[i, 0] = env
+        out[i, 1] = labor
+        out[i, 2] = supply
+        out[i, 3] = trans
+        out[i, 4] = min(features[i, _CERT_COUNT] * 1.5, 10.0)
+        
+        overall = 0.0
+        for k in range(weight_index.shape[0]):
+            overall += out[i, weight_index[k]] * weight_values[k]
+        
+        multiplier = 1.0
+        multiplier += user_flags[0] * (0.1 * (env / 10))
+        multiplier += user_flags[1] * (0.1 * (labor / 10))
+        multiplier += user_flags[2] * (0.1 * (trans / 10))
+        
+        out[i, 5] = min(overall * multiplier, 10.0)
+        out[i, 6] = multiplier
+    return out
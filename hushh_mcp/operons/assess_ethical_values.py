@@ -1,60 +1,84 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Sequence
 import json
 
-def assess_ethical_values(interactive: bool = True) -> Dict[str, Any]:
+# (question, values key, short label used in the priority summary)
+_QUESTIONS = (
+    ("Environmental sustainability (climate impact, waste reduction)", "environmental_importance", "environmental sustainability"),
+    ("Fair labor practices (worker rights, fair wages)", "labor_practices_importance", "fair labor practices"),
+    ("Local sourcing vs global supply chains", "local_sourcing_preference", "local sourcing vs global supply chains"),
+    ("Animal welfare considerations", "animal_welfare_importance", "animal welfare considerations"),
+    ("Supply chain transparency", "transparency_importance", "supply chain transparency")
+)
+
+# Balanced answers used in non-interactive mode
+_DEFAULT_VALUES = {key: 3 for _, key, _ in _QUESTIONS}
+
+def _check_score(raw: Any, key: str) -> int:
+    """Parse one provided score, rejecting anything outside 1-5."""
+    score = int(raw)
+    if not 1 <= score <= 5:
+        raise ValueError(f"Score for {key} must be between 1 and 5, got {score}")
+    return score
+
+def _prompt_score(question: str) -> int:
+    """Ask for one score until a number between 1 and 5 is entered."""
+    while True:
+        try:
+            response = input(f"❓ {question} (1-5): ")
+            score = int(response)
+            if 1 <= score <= 5:
+                return score
+            else:
+                print("Please enter a number between 1 and 5")
+        except ValueError:
+            print("Please enter a valid number")
+
+def assess_ethical_values(interactive: bool = True, raw_scores: Optional[Sequence[int]] = None) -> Dict[str, Any]:
     """
     Reusable operon for assessing user ethical values and preferences.
     
     Args:
         interactive (bool): Whether to use interactive CLI prompts
+        raw_scores (sequence, optional): Scores (1-5) for each question, in order;
+            skips prompting entirely
         
     Returns:
         dict: Structured ethical values data
+        
+    Raises:
+        ValueError: If raw_scores is not five scores in 1-5
     """
     
-    if interactive:
+    if interactive and raw_scores is None:
         print("🌱 Ethical Values Assessment")
         print("Rate each factor's importance to you (1-5 scale)\n")
     
-    questions = [
-        ("Environmental sustainability (climate impact, waste reduction)", "environmental_importance"),
-        ("Fair labor practices (worker rights, fair wages)", "labor_practices_importance"), 
-        ("Local sourcing vs global supply chains", "local_sourcing_preference"),
-        ("Animal welfare considerations", "animal_welfare_importance"),
-        ("Supply chain transparency", "transparency_importance")
-    ]
-    
-    values = {}
+    if raw_scores is not None and len(raw_scores) != len(_QUESTIONS):
+        raise ValueError(f"Expected {len(_QUESTIONS)} scores, got {len(raw_scores)}")
     
-    if interactive:
-        for question, key in questions:
-            while True:
-                try:
-                    response = input(f"❓ {question} (1-5): ")
-                    score = int(response)
-                    if 1 <= score <= 5:
-                        values[key] = score
-                        break
-                    else:
-                        print("Please enter a number between 1 and 5")
-                except ValueError:
-                    print("Please enter a valid number")
+    if raw_scores is None and not interactive:
+        # Every default is below 4, so there are no priorities to collect
+        values = dict(_DEFAULT_VALUES)
+        priorities = []
+        total_score = sum(_DEFAULT_VALUES.values())
     else:
-        # Default balanced values for non-interactive mode
-        for _, key in questions:
-            values[key] = 3
-    
-    # Generate priority summary
-    priorities = []
-    for question, key in questions:
-        if values[key] >= 4:
-            priorities.append(question.split(' (')[0].lower())
+        # Collect scores and build the priority summary in one pass
+        values = {}
+        priorities = []
+        total_score = 0
+        
+        for index, (question, key, label) in enumerate(_QUESTIONS):
+            score = _prompt_score(question) if raw_scores is None else _check_score(raw_scores[index], key)
+            values[key] = score
+            total_score += score
+            if score >= 4:
+                priorities.append(label)
     
     summary = f"Top priorities: {', '.join(priorities)}" if priorities else "Balanced approach"
     
     return {
         "values": values,
         "summary": summary,
-        "total_score": sum(values.values()),
-        "assessment_type": "interactive" if interactive else "default"
+        "total_score": total_score,
+        "assessment_type": "provided" if raw_scores is not None else "interactive" if interactive else "default"
     } 
\ No newline at end of file
@@ -1,5 +1,276 @@
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, NamedTuple, Optional, Sequence, Tuple
 import json
+import math
+
+import numpy as np
+
+# Default scoring weights
+DEFAULT_WEIGHTS = {
+    "environmental": 0.25,
+    "labor": 0.25, 
+    "supply_chain": 0.20,
+    "transparency": 0.15,
+    "certifications": 0.15
+}
+
+_FACTORS = ("environmental", "labor", "supply_chain", "transparency", "certifications")
+_FACTOR_INDEX = {factor: i for i, factor in enumerate(_FACTORS)}
+
+# User values that boost the matching component (env, labor, transparency) when rated >= 4
+_USER_PRIORITY_KEYS = ("environmental_importance", "labor_practices_importance", "transparency_importance")
+
+# Bit positions in a product's keyword/feature bitmask
+(
+    _ORGANIC, _CARBON_NEUTRAL, _RENEWABLE_ENERGY, _RECYCLABLE,
+    _FAIR_TRADE, _LIVING_WAGE, _WORKER_RIGHTS, _SA8000,
+    _LOCAL, _TIER_VISIBILITY, _PUBLIC_REPORTING, _B_CORP, _MANY_CERTS
+) = range(13)
+
+# Each component's bits are contiguous, so the bits for one component can be sliced
+# out of the mask with a shift and a mask and used as an index into a bonus table.
+_ENV_SHIFT, _LABOR_SHIFT, _SUPPLY_SHIFT, _TRANS_SHIFT = _ORGANIC, _FAIR_TRADE, _LOCAL, _PUBLIC_REPORTING
+
+def _bonus_table(coefficients: Tuple[float, ...]) -> Tuple[float, ...]:
+    """Summed bonus for every combination of a component's bits, indexed by those bits."""
+    return tuple(
+        float(sum(c for k, c in enumerate(coefficients) if mask >> k & 1))
+        for mask in range(1 << len(coefficients))
+    )
+
+# Score bonus per bit, in bit order within each component
+_ENV_BONUS = _bonus_table((1.5, 1.0, 1.0, 0.5))    # organic, carbon neutral, renewable energy, recyclable
+_LABOR_BONUS = _bonus_table((2.0, 1.5, 1.0, 1.0))  # fair trade, living wage, worker rights, sa8000
+_SUPPLY_BONUS = _bonus_table((1.5, 1.0))           # local origin, tier visibility
+_TRANS_BONUS = _bonus_table((1.5, 2.0, 1.0))       # public reporting, b-corp, many certifications
+
+# (keyword, bit) pairs, grouped by the normalized text they are matched against.
+# Each group is a handful of short keywords over short text, where CPython's
+# substring search beats a multi-pattern automaton or regex alternation.
+_CERT_KEYWORDS = (("organic", _ORGANIC), ("fair trade", _FAIR_TRADE), ("sa8000", _SA8000), ("b-corp", _B_CORP))
+_ENV_KEYWORDS = (("carbon neutral", _CARBON_NEUTRAL), ("renewable energy", _RENEWABLE_ENERGY))
+_LABOR_KEYWORDS = (("living wage", _LIVING_WAGE), ("worker rights", _WORKER_RIGHTS))
+_ORIGIN_KEYWORDS = (("local", _LOCAL), ("domestic", _LOCAL))
+_PRODUCT_KEYWORDS = (("recyclable", _RECYCLABLE),)
+
+# Fields whose text is matched against _PRODUCT_KEYWORDS
+_RECYCLABLE_FIELDS = ("packaging", "materials", "environmental_impact", "certifications")
+
+class _ProductFeatures(NamedTuple):
+    """Everything the scoring arithmetic needs from a product."""
+    flags: int  # bitmask of the _ORGANIC.._MANY_CERTS bits
+    transparency_level: float
+    cert_count: int
+
+# Column positions of each _ProductFeatures field in a batch feature matrix
+_FLAGS, _TRANSPARENCY_LEVEL, _CERT_COUNT = range(len(_ProductFeatures._fields))
+
+def _user_flags(user_values: Dict[str, int]) -> Tuple[float, ...]:
+    """1.0 for each _USER_PRIORITY_KEYS value the user rates 4 or higher, else 0.0."""
+    return tuple(float(user_values.get(key, 3) >= 4) for key in _USER_PRIORITY_KEYS)
+
+def _match_keywords(text, keywords) -> int:
+    """Bitmask of the keywords found in text (a string or a set of exact values)."""
+    flags = 0
+    for keyword, bit in keywords:
+        if keyword in text:
+            flags |= 1 << bit
+    return flags
+
+def _extract_features(product_data: Dict[str, Any]) -> _ProductFeatures:
+    """Run the keyword checks for one product."""
+    certifications = product_data.get("certifications", [])
+    supply_chain_info = product_data.get("supply_chain", {})
+    
+    # Normalize each text source once, then match all of its keywords
+    flags = (
+        _match_keywords(frozenset(c.lower() for c in certifications), _CERT_KEYWORDS)
+        | _match_keywords(str(product_data.get("environmental_impact", {})).lower(), _ENV_KEYWORDS)
+        | _match_keywords(str(product_data.get("labor_practices", {})).lower(), _LABOR_KEYWORDS)
+        | _match_keywords(product_data.get("origin", "unknown").lower(), _ORIGIN_KEYWORDS)
+        | _match_keywords(
+            "\n".join([str(product_data.get(field, "")) for field in _RECYCLABLE_FIELDS]).lower(),
+            _PRODUCT_KEYWORDS
+        )
+    )
+    if len(supply_chain_info.get("tier_visibility", [])) > 2:
+        flags |= 1 << _TIER_VISIBILITY
+    if supply_chain_info.get("public_reporting", False):
+        flags |= 1 << _PUBLIC_REPORTING
+    if len(certifications) > 2:
+        flags |= 1 << _MANY_CERTS
+    
+    return _ProductFeatures(
+        flags=flags,
+        transparency_level=supply_chain_info.get("transparency_score", 5),
+        cert_count=len(certifications)
+    )
+
+def _score_kernel_numpy(features, weight_index, weight_values, user_flags):
+    """
+    Score a (N, n_features) matrix. Returns (N, 7): the five component scores in
+    _FACTORS order, then the final score and the user preference multiplier.
+    """
+    flags = features[:, _FLAGS].astype(np.int64)
+    
+    env = np.minimum(5.0 + np.take(_ENV_BONUS, (flags >> _ENV_SHIFT) & 0xF), 10.0)
+    labor = np.minimum(5.0 + np.take(_LABOR_BONUS, (flags >> _LABOR_SHIFT) & 0xF), 10.0)
+    supply = np.minimum(features[:, _TRANSPARENCY_LEVEL] + np.take(_SUPPLY_BONUS, (flags >> _SUPPLY_SHIFT) & 0x3), 10.0)
+    trans = np.minimum(5.0 + np.take(_TRANS_BONUS, (flags >> _TRANS_SHIFT) & 0x7), 10.0)
+    cert = np.minimum(features[:, _CERT_COUNT] * 1.5, 10.0)
+    
+    out = np.empty((features.shape[0], 7))
+    out[:, 0] = env
+    out[:, 1] = labor
+    out[:, 2] = supply
+    out[:, 3] = trans
+    out[:, 4] = cert
+    
+    # Accumulate in the caller's weight order so results match the per-product path exactly
+    overall = np.zeros(features.shape[0])
+    for index, weight in zip(weight_index, weight_values):
+        overall += out[:, index] * weight
+    
+    multiplier = np.ones(features.shape[0])
+    multiplier += user_flags[0] * (0.1 * (env / 10))
+    multiplier += user_flags[1] * (0.1 * (labor / 10))
+    multiplier += user_flags[2] * (0.1 * (trans / 10))
+    
+    out[:, 5] = np.minimum(overall * multiplier, 10.0)
+    out[:, 6] = multiplier
+    return out
+
+# Resolved on first use by _get_score_kernel
+_score_kernel = None
+
+def _get_score_kernel():
+    """
+    The Numba kernel when numba is installed, else _score_kernel_numpy. Imported lazily
+    so importing this operon doesn't pay for numba start-up or kernel loading unless a
+    batch is actually scored.
+    """
+    global _score_kernel
+    if _score_kernel is None:
+        try:
+            from hushh_mcp.operons._score_ethical_factors_jit import score_kernel
+        except ImportError:
+            score_kernel = _score_kernel_numpy
+        _score_kernel = score_kernel
+    return _score_kernel
+
+# Explanation text for each component, in _FACTORS order
+_STRENGTH_LABELS = tuple(f"Strong {factor.replace('_', ' ')} practices" for factor in _FACTORS)
+_CONCERN_LABELS = tuple(f"Limited {factor.replace('_', ' ')} information" for factor in _FACTORS)
+
+def _explain(components: Sequence[float]) -> Tuple[List[str], List[str]]:
+    """Turn component scores (in _FACTORS order) into strengths and concerns."""
+    strengths = []
+    concerns = []
+    
+    for score, strength, concern in zip(components, _STRENGTH_LABELS, _CONCERN_LABELS):
+        if score >= 7.5:
+            strengths.append(strength)
+        elif score <= 4.0:
+            concerns.append(concern)
+    
+    return strengths, concerns
+
+def _round_tenths(values: np.ndarray) -> np.ndarray:
+    """
+    np.round(values, 1) corrected to match Python's round(v, 1) exactly. np.round
+    scales by 10 before rounding, which only disagrees with Python's correctly
+    rounded result when v * 10 sits right next to a .5 tie; those few entries
+    fall back to round().
+    """
+    rounded = np.round(values, 1)
+    scaled = values * 10
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for index in zip(*np.nonzero(near_tie)):
+        rounded[index] = round(float(values[index]), 1)
+    return rounded
+
+def _result(
+    components: Sequence[float],
+    rounded: List[float],
+    user_weight_multiplier: float,
+    certifications: List[str]
+) -> Dict[str, Any]:
+    """
+    Assemble the public scoring breakdown for one product from its component scores
+    (in _FACTORS order). `rounded` holds the same five scores followed by the final
+    score, each rounded to one decimal.
+    """
+    strengths, concerns = _explain(components)
+    
+    return {
+        "overall_score": rounded[5],
+        "component_scores": dict(zip(_FACTORS, rounded[:5])),
+        "strengths": strengths,
+        "concerns": concerns,
+        "certifications_found": certifications,
+        "user_alignment": "high" if user_weight_multiplier > 1.05 else "moderate",
+        "scoring_methodology": "weighted_multi_factor"
+    }
+
+def _compile_scorer(weights_items: Tuple[Tuple[str, float], ...]):
+    """
+    Compile the weighted overall score for one set of weights, with the weights baked
+    in as float literals. The returned function takes the five component scores
+    positionally in _FACTORS order and sums the terms in the order of weights_items.
+    """
+    for factor, _ in weights_items:
+        if factor not in _FACTOR_INDEX:
+            raise KeyError(factor)
+    
+    terms = " + ".join(f"{factor} * {float(weight)!r}" for factor, weight in weights_items)
+    source = f"def scorer({', '.join(_FACTORS)}):\n    return {terms or '0'}\n"
+    
+    namespace = {"inf": math.inf, "nan": math.nan}  # repr() of non-finite weights
+    exec(compile(source, "<score_ethical_factors weights>", "exec"), namespace)
+    return namespace["scorer"]
+
+# Weighted sum for DEFAULT_WEIGHTS, compiled once at import. Any other weights use a
+# plain left-to-right loop with the same term order, so results are bit-identical.
+_default_scorer = _compile_scorer(tuple(DEFAULT_WEIGHTS.items()))
+
+def _score_core(
+    product_data: Dict[str, Any],
+    user_values: Dict[str, int],
+    weights: Dict[str, float]
+) -> Tuple[Tuple[float, ...], float, float]:
+    """Component scores in _FACTORS order, final score and user preference multiplier."""
+    features = _extract_features(product_data)
+    
+    flags = features.flags
+    
+    # Component scores (0-10 scale): each is its baseline plus a table lookup on its
+    # bits, with no per-keyword branches
+    env_score = min(5.0 + _ENV_BONUS[(flags >> _ENV_SHIFT) & 0xF], 10.0)
+    labor_score = min(5.0 + _LABOR_BONUS[(flags >> _LABOR_SHIFT) & 0xF], 10.0)
+    supply_score = min(features.transparency_level + _SUPPLY_BONUS[(flags >> _SUPPLY_SHIFT) & 0x3], 10.0)
+    trans_score = min(5.0 + _TRANS_BONUS[(flags >> _TRANS_SHIFT) & 0x7], 10.0)
+    cert_score = min(features.cert_count * 1.5, 10.0)
+    
+    # Calculate weighted overall score
+    if weights is DEFAULT_WEIGHTS:
+        overall_score = _default_scorer(env_score, labor_score, supply_score, trans_score, cert_score)
+    else:
+        components = (env_score, labor_score, supply_score, trans_score, cert_score)
+        overall_score = 0
+        for factor, weight in weights.items():
+            overall_score += components[_FACTOR_INDEX[factor]] * weight
+    
+    # Apply user preference weighting
+    env_flag, labor_flag, trans_flag = _user_flags(user_values)
+    user_weight_multiplier = (
+        1.0
+        + env_flag * (0.1 * (env_score / 10))
+        + labor_flag * (0.1 * (labor_score / 10))
+        + trans_flag * (0.1 * (trans_score / 10))
+    )
+    
+    final_score = min(overall_score * user_weight_multiplier, 10.0)
+    
+    return (env_score, labor_score, supply_score, trans_score, cert_score), final_score, user_weight_multiplier
 
 def score_ethical_factors(
     product_data: Dict[str, Any], 
@@ -18,109 +289,55 @@ def score_ethical_factors(
         dict: Comprehensive ethical scoring breakdown
     """
     
-    # Default scoring weights
     if weights is None:
-        weights = {
-            "environmental": 0.25,
-            "labor": 0.25, 
-            "supply_chain": 0.20,
-            "transparency": 0.15,
-            "certifications": 0.15
-        }
-    
-    # Extract product characteristics
-    certifications = product_data.get("certifications", [])
-    origin = product_data.get("origin", "unknown")
-    labor_practices = product_data.get("labor_practices", {})
-    environmental_impact = product_data.get("environmental_impact", {})
-    supply_chain_info = product_data.get("supply_chain", {})
-    
-    # Calculate component scores (0-10 scale)
-    scores = {}
-    
-    # Environmental score
-    env_score = 5.0  # baseline
-    if "organic" in [c.lower() for c in certifications]:
-        env_score += 1.5
-    if "carbon neutral" in str(environmental_impact).lower():
-        env_score += 1.0
-    if "renewable energy" in str(environmental_impact).lower():
-        env_score += 1.0
-    if "recyclable" in str(product_data).lower():
-        env_score += 0.5
-    
-    scores["environmental"] = min(env_score, 10.0)
-    
-    # Labor practices score
-    labor_score = 5.0  # baseline
-    if "fair trade" in [c.lower() for c in certifications]:
-        labor_score += 2.0
-    if "living wage" in str(labor_practices).lower():
-        labor_score += 1.5
-    if "worker rights" in str(labor_practices).lower():
-        labor_score += 1.0
-    if "sa8000" in [c.lower() for c in certifications]:
-        labor_score += 1.0
-    
-    scores["labor"] = min(labor_score, 10.0)
-    
-    # Supply chain score
-    supply_score = 5.0  # baseline
-    transparency_level = supply_chain_info.get("transparency_score", 5)
-    supply_score = transparency_level
-    
-    if "local" in origin.lower() or "domestic" in origin.lower():
-        supply_score += 1.5
-    if len(supply_chain_info.get("tier_visibility", [])) > 2:
-        supply_score += 1.0
-    
-    scores["supply_chain"] = min(supply_score, 10.0)
+        weights = DEFAULT_WEIGHTS
     
-    # Transparency score
-    trans_score = 5.0  # baseline
-    if supply_chain_info.get("public_reporting", False):
-        trans_score += 1.5
-    if "b-corp" in [c.lower() for c in certifications]:
-        trans_score += 2.0
-    if len(certifications) > 2:
-        trans_score += 1.0
+    component_scores, final_score, user_weight_multiplier = _score_core(product_data, user_values, weights)
     
-    scores["transparency"] = min(trans_score, 10.0)
+    return _result(
+        component_scores,
+        [round(v, 1) for v in (*component_scores, final_score)],
+        user_weight_multiplier,
+        product_data.get("certifications", [])
+    )
+
+def score_ethical_factors_batch(
+    products: List[Dict[str, Any]],
+    user_values: Dict[str, int],
+    weights: Optional[Dict[str, float]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Score a list of products in one call. Only the scoring arithmetic is vectorized
+    (one kernel over the whole batch, Numba-compiled when numba is installed); keyword
+    checks and result dicts are still built per product, so this is a convenience
+    rather than a speedup over calling score_ethical_factors in a loop.
     
-    # Certification bonus
-    cert_score = min(len(certifications) * 1.5, 10.0)
-    scores["certifications"] = cert_score
+    Args:
+        products (list): Product dicts, as accepted by score_ethical_factors
+        user_values (dict): User's ethical preference scores (1-5)
+        weights (dict, optional): Custom scoring weights
+        
+    Returns:
+        list: One scoring breakdown per product, identical to score_ethical_factors
+    """
+    if not products:
+        return []
     
-    # Calculate weighted overall score
-    overall_score = sum(scores[factor] * weights[factor] for factor in weights.keys())
+    if weights is None:
+        weights = DEFAULT_WEIGHTS
     
-    # Apply user preference weighting
-    user_weight_multiplier = 1.0
-    if user_values.get("environmental_importance", 3) >= 4:
-        user_weight_multiplier += 0.1 * (scores["environmental"] / 10)
-    if user_values.get("labor_practices_importance", 3) >= 4:
-        user_weight_multiplier += 0.1 * (scores["labor"] / 10)
-    if user_values.get("transparency_importance", 3) >= 4:
-        user_weight_multiplier += 0.1 * (scores["transparency"] / 10)
+    features = np.array(list(map(_extract_features, products)), dtype=np.float64)
+    weight_index = np.array([_FACTOR_INDEX[factor] for factor in weights], dtype=np.intp)
+    weight_values = np.array(list(weights.values()), dtype=np.float64)
+    user_flags = np.array(_user_flags(user_values))
     
-    final_score = min(overall_score * user_weight_multiplier, 10.0)
+    out = _get_score_kernel()(features, weight_index, weight_values, user_flags)
     
-    # Generate explanation
-    strengths = []
-    concerns = []
+    # Round the component and final score columns for the whole batch at once
+    rounded_rows = _round_tenths(out[:, :6]).tolist()
     
-    for factor, score in scores.items():
-        if score >= 7.5:
-            strengths.append(f"Strong {factor.replace('_', ' ')} practices")
-        elif score <= 4.0:
-            concerns.append(f"Limited {factor.replace('_', ' ')} information")
+    results = []
+    for product, row, rounded in zip(products, out.tolist(), rounded_rows):
+        results.append(_result(row[:5], rounded, row[6], product.get("certifications", [])))
     
-    return {
-        "overall_score": round(final_score, 1),
-        "component_scores": {k: round(v, 1) for k, v in scores.items()},
-        "strengths": strengths,
-        "concerns": concerns,
-        "certifications_found": certifications,
-        "user_alignment": "high" if user_weight_multiplier > 1.05 else "moderate",
-        "scoring_methodology": "weighted_multi_factor"
-    } 
\ No newline at end of file
+    return results
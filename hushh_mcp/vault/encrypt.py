@@ -16,6 +16,9 @@ ALGORITHM_NAME = "aes-256-gcm"
 # ==================== Encrypt ====================
 
 def encrypt_data(plaintext: str, key_hex: str) -> EncryptedPayload:
+    return encrypt_bytes(plaintext.encode('utf-8'), key_hex)
+
+def encrypt_bytes(plaintext: bytes, key_hex: str) -> EncryptedPayload:
     try:
         key = bytes.fromhex(key_hex)
         iv = os.urandom(IV_LENGTH)
@@ -24,7 +27,7 @@ def encrypt_data(plaintext: str, key_hex: str) -> EncryptedPayload:
         cipher = Cipher(algorithms.AES(key), modes.GCM(iv), backend=backend)
         encryptor = cipher.encryptor()
 
-        ciphertext = encryptor.update(plaintext.encode('utf-8')) + encryptor.finalize()
+        ciphertext = encryptor.update(plaintext) + encryptor.finalize()
         tag = encryptor.tag
 
         return EncryptedPayload(
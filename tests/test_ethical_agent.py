@@ -1,20 +1,51 @@
 import pytest
 import json
+import io
+import asyncio
+import numpy as np
 from unittest.mock import patch, MagicMock
 
 from hushh_mcp.consent.token import issue_token, revoke_token
 from hushh_mcp.constants import ConsentScope
-from hushh_mcp.agents.ethical_consumption_agent.index import EthicalConsumptionAgent, EthicalValues
+from hushh_mcp.vault.encrypt import decrypt_data
+from hushh_mcp.config import VAULT_ENCRYPTION_KEY
+from hushh_mcp.agents.ethical_consumption_agent.index import (
+    EthicalConsumptionAgent,
+    EthicalValues,
+    ProductCatalog,
+    _score_products_numpy,
+)
 from hushh_mcp.operons.assess_ethical_values import assess_ethical_values
-from hushh_mcp.operons.score_ethical_factors import score_ethical_factors
+from hushh_mcp.operons.score_ethical_factors import (
+    score_ethical_factors,
+    score_ethical_factors_batch,
+    DEFAULT_WEIGHTS,
+    _compile_scorer,
+    _round_tenths,
+    _get_score_kernel,
+    _score_kernel_numpy,
+)
 
 
 class TestEthicalConsumptionAgent:
     """Test suite for Ethical Consumption Agent with consent validation."""
     
+    @classmethod
+    def setup_class(cls):
+        """Issue one consent token per scope, shared by tests that only need a valid token."""
+        cls.user_id = "user_test_123"
+        cls.tokens = {
+            scope: issue_token(cls.user_id, "ethical_consumption_agent", scope)
+            for scope in (
+                ConsentScope("custom.ethical.values"),
+                ConsentScope.VAULT_READ_EMAIL,
+                ConsentScope.AGENT_SHOPPING_PURCHASE,
+                ConsentScope("custom.supply.chain"),
+            )
+        }
+    
     def setup_method(self):
         """Set up test fixtures."""
-        self.user_id = "user_test_123"
         self.agent = EthicalConsumptionAgent()
         
     def test_agent_initialization(self):
@@ -26,12 +57,7 @@ class TestEthicalConsumptionAgent:
         
     def test_ethical_values_assessment_with_consent(self):
         """Test values assessment with valid consent token."""
-        # Issue valid consent token
-        token = issue_token(
-            self.user_id, 
-            "ethical_consumption_agent", 
-            ConsentScope("custom.ethical.values")
-        )
+        token = self.tokens[ConsentScope("custom.ethical.values")]
         
         # Mock input for non-interactive testing
         with patch('builtins.input', side_effect=['4', '5', '3', '4', '5']):
@@ -60,11 +86,7 @@ class TestEthicalConsumptionAgent:
             
     def test_purchase_history_analysis_with_consent(self):
         """Test purchase history analysis with valid consent."""
-        token = issue_token(
-            self.user_id,
-            "ethical_consumption_agent", 
-            ConsentScope.VAULT_READ_EMAIL
-        )
+        token = self.tokens[ConsentScope.VAULT_READ_EMAIL]
         
         result = self.agent.analyze_purchase_history(self.user_id, token.token)
         
@@ -75,6 +97,18 @@ class TestEthicalConsumptionAgent:
         assert result["analysis"]["eco_score"] > 0
         assert len(result["analysis"]["top_issues"]) > 0
         
+    def test_purchase_history_results_are_independent(self):
+        """Test mutating one analysis result doesn't change later results."""
+        token = self.tokens[ConsentScope.VAULT_READ_EMAIL]
+        
+        first = self.agent.analyze_purchase_history(self.user_id, token.token)
+        first["analysis"]["recommendations"].append("LEAK")
+        first["encrypted_data"].ciphertext = "LEAK"
+        second = self.agent.analyze_purchase_history(self.user_id, token.token)
+        
+        assert "LEAK" not in second["analysis"]["recommendations"]
+        assert json.loads(decrypt_data(second["encrypted_data"], VAULT_ENCRYPTION_KEY)) == second["analysis"]
+        
     def test_purchase_history_analysis_without_consent(self):
         """Test purchase history analysis fails without consent."""
         with pytest.raises(PermissionError):
@@ -82,11 +116,7 @@ class TestEthicalConsumptionAgent:
             
     def test_product_search_with_consent(self):
         """Test product search with valid consent token."""
-        token = issue_token(
-            self.user_id,
-            "ethical_consumption_agent",
-            ConsentScope.AGENT_SHOPPING_PURCHASE
-        )
+        token = self.tokens[ConsentScope.AGENT_SHOPPING_PURCHASE]
         
         result = self.agent.search_ethical_products(
             self.user_id, 
@@ -108,13 +138,32 @@ class TestEthicalConsumptionAgent:
         assert first_rec["ethical_score"] > 0
         assert first_rec["eco_score"] > 0
         
+    def test_product_search_results_cached(self):
+        """Test repeat searches reuse cached analysis but still check consent."""
+        token = self.tokens[ConsentScope.AGENT_SHOPPING_PURCHASE]
+        EthicalConsumptionAgent.clear_search_cache()
+
+        first = self.agent.search_ethical_products(self.user_id, token.token, "Bamboo Toothbrush", budget=10)
+        second = self.agent.search_ethical_products(self.user_id, token.token, "  bamboo toothbrush ", budget=10)
+
+        assert second["results"]["query"] == "  bamboo toothbrush "
+        assert second["results"]["recommendations"] == first["results"]["recommendations"]
+        assert len(EthicalConsumptionAgent._search_cache) == 1
+
+        # Cached results are copied out, so mutating one response can't leak into the next
+        first["results"]["recommendations"][0]["strengths"].append("LEAK")
+        third = self.agent.search_ethical_products(self.user_id, token.token, "bamboo toothbrush", budget=10)
+        assert "LEAK" not in third["results"]["recommendations"][0]["strengths"]
+
+        with pytest.raises(PermissionError):
+            self.agent.search_ethical_products(self.user_id, "invalid_token", "bamboo toothbrush", budget=10)
+
+        EthicalConsumptionAgent.clear_search_cache()
+        assert EthicalConsumptionAgent._search_cache == {}
+
     def test_supply_chain_trace_with_consent(self):
         """Test supply chain tracing with valid consent."""
-        token = issue_token(
-            self.user_id,
-            "ethical_consumption_agent",
-            ConsentScope("custom.supply.chain")
-        )
+        token = self.tokens[ConsentScope("custom.supply.chain")]
         
         result = self.agent.trace_supply_chain(
             self.user_id,
@@ -134,10 +183,12 @@ class TestEthicalConsumptionAgent:
         
     def test_consent_token_revocation(self):
         """Test that revoked tokens are rejected."""
+        # Fresh token with a distinct expiry, so revoking it can't touch the shared ones
         token = issue_token(
             self.user_id,
             "ethical_consumption_agent",
-            ConsentScope("custom.ethical.values")
+            ConsentScope("custom.ethical.values"),
+            expires_in_ms=2 * 60 * 60 * 1000
         )
         
         # Revoke the token
@@ -147,13 +198,37 @@ class TestEthicalConsumptionAgent:
         with pytest.raises(PermissionError, match="Token has been revoked"):
             self.agent.assess_ethical_values(self.user_id, token.token)
             
-    def test_comprehensive_report_generation(self):
-        """Test comprehensive report generation."""
+    def test_token_validation_is_cached(self):
+        """Test repeated calls reuse a cached validation."""
+        token = self.tokens[ConsentScope.VAULT_READ_EMAIL]
+
+        self.agent.analyze_purchase_history(self.user_id, token.token)
+
+        with patch('hushh_mcp.agents.ethical_consumption_agent.index.validate_token') as mock_validate:
+            result = self.agent.analyze_purchase_history(self.user_id, token.token)
+
+        assert result["status"] == "success"
+        mock_validate.assert_not_called()
+
+    def test_cached_token_revocation(self):
+        """Test that revoking a token invalidates its cached validation."""
+        # Distinct expiry so the revoked token can't collide with one issued elsewhere
         token = issue_token(
             self.user_id,
             "ethical_consumption_agent",
-            ConsentScope.VAULT_READ_EMAIL
+            ConsentScope.VAULT_READ_EMAIL,
+            expires_in_ms=60 * 60 * 1000
         )
+
+        self.agent.analyze_purchase_history(self.user_id, token.token)
+        revoke_token(token.token)
+
+        with pytest.raises(PermissionError, match="Token has been revoked"):
+            self.agent.analyze_purchase_history(self.user_id, token.token)
+
+    def test_comprehensive_report_generation(self):
+        """Test comprehensive report generation."""
+        token = self.tokens[ConsentScope.VAULT_READ_EMAIL]
         
         result = self.agent.generate_report(self.user_id, token.token)
         
@@ -167,6 +242,46 @@ class TestEthicalConsumptionAgent:
         assert "areas_for_improvement" in report
         assert "personalized_recommendations" in report
         
+    def test_report_generation_wrong_user(self):
+        """Test report generation rejects a token issued to another user."""
+        token = issue_token(
+            "different_user",
+            "ethical_consumption_agent",
+            ConsentScope.VAULT_READ_EMAIL
+        )
+
+        with pytest.raises(PermissionError, match="Token user ID does not match"):
+            self.agent.generate_report(self.user_id, token.token)
+
+    def test_report_skips_failed_sources(self):
+        """Test a failing data source is dropped instead of failing the report."""
+        token = self.tokens[ConsentScope.VAULT_READ_EMAIL]
+
+        with patch.object(self.agent, "_fetch_finance_data", side_effect=RuntimeError("finance vault offline")):
+            result = self.agent.generate_report(self.user_id, token.token)
+
+        report = result["report"]
+        assert result["status"] == "success"
+        assert "ethical_score_trend" in report
+        assert "personalized_recommendations" in report
+        assert "top_achievements" not in report
+
+    def test_report_generation_inside_running_loop(self):
+        """Test the sync report works from async code and the async variant can be awaited."""
+        token = self.tokens[ConsentScope.VAULT_READ_EMAIL]
+
+        async def main():
+            sync_result = self.agent.generate_report(self.user_id, token.token)
+            async_result = await self.agent.generate_report_async(self.user_id, token.token)
+            with pytest.raises(PermissionError, match="Consent validation failed"):
+                await self.agent.generate_report_async(self.user_id, "invalid_token")
+            return sync_result, async_result
+
+        sync_result, async_result = asyncio.run(main())
+
+        assert sync_result["status"] == "success"
+        assert async_result == sync_result
+
     def test_values_summary_generation(self):
         """Test ethical values summary generation."""
         values = EthicalValues(
@@ -185,6 +300,43 @@ class TestEthicalConsumptionAgent:
         assert "local sourcing" not in summary  # Score was only 2
         assert "animal welfare" not in summary  # Score was only 1
 
+    def test_score_products_ranks_by_user_values(self):
+        """Test batched product scoring weights factors by user values."""
+        catalog = ProductCatalog.from_products([
+            {"name": "Green Co", "environmental": 9.0, "labor": 4.0, "transparency": 6.0},
+            {"name": "Fair Co", "environmental": 4.0, "labor": 9.0, "transparency": 6.0},
+            {"name": "Unknown Co"}
+        ])
+        values = EthicalValues(
+            environmental_importance=5,
+            labor_practices_importance=1,
+            local_sourcing_preference=3,
+            animal_welfare_importance=3,
+            transparency_importance=3
+        )
+
+        scores = self.agent.score_products(catalog, values)
+
+        assert scores.shape == (3,)
+        assert scores[0] > scores[1]
+        assert scores[2] == pytest.approx(5.0)
+
+    def test_score_products_kernel_matches_numpy(self):
+        """Test the compiled kernel agrees with the NumPy fallback."""
+        catalog = ProductCatalog.from_products([
+            {"name": f"Product {i}", "environmental": i % 10, "labor": (i * 3) % 10}
+            for i in range(50)
+        ])
+        values = EthicalValues(4, 5, 3, 2, 4)
+        weights = np.asarray(values, dtype=np.float32) / sum(values)
+
+        expected = _score_products_numpy(
+            catalog.environmental, catalog.labor, catalog.local_sourcing,
+            catalog.animal_welfare, catalog.transparency, weights
+        )
+
+        np.testing.assert_allclose(self.agent.score_products(catalog, values), expected, rtol=1e-5)
+
 
 class TestEthicalValueOperon:
     """Test the reusable ethical values assessment operon."""
@@ -200,6 +352,31 @@ class TestEthicalValueOperon:
         assert result["values"]["labor_practices_importance"] == 5
         assert result["assessment_type"] == "interactive"
         
+    def test_assess_ethical_values_raw_scores(self):
+        """Test scores passed directly skip prompting."""
+        result = assess_ethical_values(raw_scores=[4, 5, 3, 2, 4])
+        
+        assert "values" in result
+        assert "summary" in result
+        assert result["values"]["environmental_importance"] == 4
+        assert result["values"]["labor_practices_importance"] == 5
+        assert result["total_score"] == 18
+        assert result["assessment_type"] == "provided"
+        
+        with pytest.raises(ValueError):
+            assess_ethical_values(raw_scores=[4, 5, 3])
+        with pytest.raises(ValueError):
+            assess_ethical_values(raw_scores=[4, 5, 3, 2, 6])
+            
+    def test_assess_ethical_values_piped_stdin(self):
+        """Test scripted answers piped one per line are read through the prompts."""
+        with patch('sys.stdin', io.StringIO("2\n2\n5\n1\n4\n")):
+            result = assess_ethical_values(interactive=True)
+            
+        assert result["values"]["local_sourcing_preference"] == 5
+        assert result["values"]["transparency_importance"] == 4
+        assert result["assessment_type"] == "interactive"
+        
     def test_assess_ethical_values_batch_mode(self):
         """Test batch mode with default values."""
         result = assess_ethical_values(interactive=False)
@@ -290,7 +467,81 @@ class TestEthicalScoringOperon:
         
         # Environmental should be highly weighted
         assert result["component_scores"]["environmental"] > 0
+
+    def test_score_ethical_factors_batch_matches_single(self):
+        """Test batch scoring gives the same breakdown as scoring one product at a time."""
+        products = [
+            {
+                "certifications": ["Fair Trade", "B-Corp", "Organic"],
+                "origin": "Local, USA",
+                "labor_practices": {"policy": "living wage, worker rights"},
+                "environmental_impact": {"energy": "Renewable energy", "shipping": "Carbon neutral"},
+                "supply_chain": {"transparency_score": 8, "tier_visibility": [1, 2, 3], "public_reporting": True}
+            },
+            {
+                "certifications": [],
+                "origin": "Unknown",
+                "supply_chain": {"transparency_score": 2}
+            },
+            {
+                "certifications": ["SA8000"],
+                "packaging": "Recyclable cardboard"
+            }
+        ]
+        user_values = {"environmental_importance": 5, "labor_practices_importance": 4}
+        custom_weights = {"environmental": 0.5, "labor": 0.3, "certifications": 0.2}
+
+        for weights in (None, custom_weights):
+            batch = score_ethical_factors_batch(products, user_values, weights)
+            assert batch == [score_ethical_factors(p, user_values, weights) for p in products]
+
+    def test_score_kernel_matches_numpy(self):
+        """Test the compiled scoring kernel agrees exactly with the NumPy fallback."""
+        rng = np.random.default_rng(42)
+        features = np.column_stack((
+            rng.integers(0, 1 << 13, size=500),  # keyword/feature bitmask
+            rng.integers(0, 11, size=500),       # transparency level
+            rng.integers(0, 8, size=500)         # certification count
+        )).astype(np.float64)
+        weight_index = np.array([1, 0, 4, 2], dtype=np.intp)
+        weight_values = np.array([0.3, 0.4, 0.2, 0.1])
+        user_flags = np.array([1.0, 0.0, 1.0])
+
+        np.testing.assert_array_equal(
+            _get_score_kernel()(features, weight_index, weight_values, user_flags),
+            _score_kernel_numpy(features, weight_index, weight_values, user_flags)
+        )
+
+    def test_score_ethical_factors_batch_empty(self):
+        """Test batch scoring an empty catalog."""
+        assert score_ethical_factors_batch([], {}) == []
+
+    def test_compile_scorer_bakes_in_weights(self):
+        """Test compiled scorers sum weighted components in weight order."""
+        scorer = _compile_scorer((("labor", 0.5), ("environmental", 0.25)))
+        
+        assert scorer(8.0, 6.0, 0.0, 0.0, 0.0) == 6.0 * 0.5 + 8.0 * 0.25
+        with pytest.raises(KeyError):
+            _compile_scorer((("unknown_factor", 1.0),))
+        with pytest.raises(KeyError):
+            score_ethical_factors({}, {}, {"unknown_factor": 1.0})
+
+    def test_default_and_custom_weights_agree(self):
+        """Test the compiled default-weight path matches the generic path exactly."""
+        product_data = {"certifications": ["Organic"], "supply_chain": {"transparency_score": 6.3}}
+        user_values = {"labor_practices_importance": 5}
+        
+        assert score_ethical_factors(product_data, user_values) == \
+            score_ethical_factors(product_data, user_values, dict(DEFAULT_WEIGHTS))
+
+    def test_round_tenths_matches_python_round(self):
+        """Test vectorized rounding agrees with round(v, 1), including near-ties."""
+        values = [0.05, 0.15, 0.35, 2.675, 6.35, 7.45, 8.25, 9.95, 1.2345, 3.0, 10.0]
+        values += [k / 20 + 1e-12 for k in range(200)] + [k / 20 - 1e-12 for k in range(1, 200)]
+        
+        assert _round_tenths(np.array(values)).tolist() == [round(v, 1) for v in values]
+
         
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"]) 
\ No newline at end of file
+    pytest.main([__file__, "-v"])
\ No newline at end of file
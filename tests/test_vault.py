@@ -3,7 +3,7 @@
 import pytest
 import json
 import base64
-from hushh_mcp.vault.encrypt import encrypt_data, decrypt_data
+from hushh_mcp.vault.encrypt import encrypt_data, encrypt_bytes, decrypt_data
 from hushh_mcp.config import VAULT_ENCRYPTION_KEY
 from hushh_mcp.types import EncryptedPayload
 
@@ -25,6 +25,16 @@ def test_encrypt_decrypt_roundtrip():
     assert decrypted == plaintext
 
 
+
+def test_encrypt_bytes_roundtrip():
+    plaintext = json.dumps({"email": "alice@hushh.ai"}).encode("utf-8")
+
+    encrypted = encrypt_bytes(plaintext, VAULT_ENCRYPTION_KEY)
+    decrypted = decrypt_data(encrypted, VAULT_ENCRYPTION_KEY)
+
+    assert decrypted == plaintext.decode("utf-8")
+
+
 def test_decryption_fails_with_wrong_key():
     plaintext = "sensitive data"
     encrypted = encrypt_data(plaintext, VAULT_ENCRYPTION_KEY)